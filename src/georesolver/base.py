@@ -1,14 +1,19 @@
 from abc import ABC, abstractmethod
-from typing import Union, Optional, Dict, Any
+from typing import Union, Optional, Dict, Any, List
 from ratelimit import limits, sleep_and_retry
 import requests
 import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from georesolver.utils.LoggerHandler import setup_logger
 
 class BaseQuery(ABC):
     """
     Base class for geolocation API services.
-    Handles caching, rate limiting, and basic GET requests.
+    Handles caching, rate limiting, and basic GET and POST requests.
+
+    Requests are sent through a persistent session with a pooled connection adapter,
+    so TCP/TLS connections are reused across calls to the same service.
     """
 
     def __init__(
@@ -18,6 +23,7 @@ class BaseQuery(ABC):
         cache_expiry: int = 86400,  # 1 day
         rate_limit: tuple = (30, 1),  # 30 calls per 1 second
         enable_cache: bool = True,
+        timeout: int = 10,
         verbose: bool = False
     ):
         self.logger = setup_logger(self.__class__.__name__, verbose)
@@ -28,6 +34,26 @@ class BaseQuery(ABC):
             requests_cache.install_cache(cache_name, expire_after=cache_expiry)
             self.logger.info(f"Installed cache '{cache_name}' (expires after {cache_expiry}s)")
 
+        self.timeout = timeout
+        self.session = self._build_session()
+
+    def _build_session(self) -> requests.Session:
+        """
+        Create a session that keeps connections alive and retries transient errors.
+        When the cache is enabled, `requests.Session` is patched by `requests_cache`,
+        so the session is created after installing the cache.
+        """
+        session = requests.Session()
+        retries = Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[429, 500, 502, 503, 504]
+        )
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=retries)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
     @sleep_and_retry
     @limits(calls=30, period=1)
     def _limited_get(self, 
@@ -38,7 +64,7 @@ class BaseQuery(ABC):
         """
         full_url = f"{self.base_url}{url}" if not url.startswith("http") else url
         try:
-            response = requests.get(full_url, params=params)
+            response = self.session.get(full_url, params=params, timeout=self.timeout)
             response.raise_for_status()
             if getattr(response, "from_cache", False):
                 self.logger.info(f"[CACHE HIT] {response.url}")
@@ -49,6 +75,26 @@ class BaseQuery(ABC):
             self.logger.error(f"Request failed for URL: {full_url}, params: {params}, error: {e}")
             raise
 
+    @sleep_and_retry
+    @limits(calls=30, period=1)
+    def _limited_post(self,
+                      url: str,
+                      data: Optional[Dict[str, Any]] = None,
+                      headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """
+        Internal method to perform a POST request with rate limiting.
+        POST responses are not stored by the HTTP cache.
+        """
+        full_url = f"{self.base_url}{url}" if not url.startswith("http") else url
+        try:
+            response = self.session.post(full_url, data=data, headers=headers, timeout=self.timeout)
+            response.raise_for_status()
+            self.logger.info(f"[API CALL] POST {response.url}")
+            return response
+        except requests.RequestException as e:
+            self.logger.error(f"Request failed for URL: {full_url}, error: {e}")
+            raise
+
     @abstractmethod
     def places_by_name(self, 
                        place_name: str, 
@@ -69,6 +115,31 @@ class BaseQuery(ABC):
         """
         pass
 
+    def places_by_names(self,
+                        place_names: List[str],
+                        country_code: Optional[str],
+                        place_type: Optional[str] = None,
+                        lang: Optional[str] = None) -> Dict[str, Union[dict, list]]:
+        """
+        Search for several places sharing the same country code and place type.
+        Subclasses can override this method to reduce the number of requests
+        (e.g. a single query for all names, or concurrent requests).
+
+        Parameters:
+            place_names (List[str]): Names of the places to search for
+            country_code (Optional[str]): ISO 3166-1 alpha-2 country code
+            place_type (Optional[str]): Optional place type filter
+            lang (Optional[str]): Language code for place type
+
+        Returns:
+            Dict[str, Union[dict, list]]: Search results keyed by place name, in the
+                                          same format returned by `places_by_name`
+        """
+        return {
+            name: self.places_by_name(name, country_code, place_type, lang=lang)
+            for name in dict.fromkeys(place_names)
+        }
+
     @abstractmethod
     def get_best_match(self, 
                        results: Union[dict, list], 
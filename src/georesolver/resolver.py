@@ -1,19 +1,30 @@
+import asyncio
+import copy
+import functools
+import hashlib
+import logging
+import threading
 import traceback
-from typing import Union, Optional, Dict, List
-from SPARQLWrapper import SPARQLWrapper, JSON
-from rapidfuzz import fuzz
+from collections import deque
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Union, Optional, Dict, List, Tuple, Iterable
+from rapidfuzz import fuzz, process
+from rapidfuzz.utils import default_process
 import os
-import json
+import re
+from string import Template
 from importlib.resources import files
 import requests
+import orjson
 import pandas as pd
 import pycountry
 from tqdm import tqdm
-import ast
 from dotenv import load_dotenv
 from ratelimit import limits, sleep_and_retry
 
 from georesolver.utils.LoggerHandler import setup_logger
+from georesolver.utils.CacheHandler import LRUCache, ResolvedCache
 from georesolver.base import BaseQuery
 
 load_dotenv(".env")
@@ -21,19 +32,183 @@ load_dotenv(".env")
 TGN_ENDPOINT = "http://vocab.getty.edu/sparql"
 WHG_ENDPOINT = "https://whgazetteer.org/api"
 GEONAMES_ENDPOINT = "http://api.geonames.org"
-WIKIDATA_ENDPOINT = "https://www.wikidata.org/w/api.php"
-ENTITYDATA_ENDPOINT = "https://www.wikidata.org/wiki/Special:EntityData/"
+WIKIDATA_ENDPOINT = "https://query.wikidata.org/sparql"
+
+_TGN_QUERY_PREFIXES = """
+    PREFIX skos: <http://www.w3.org/2004/02/skos/core#>
+    PREFIX luc: <http://www.ontotext.com/owlim/lucene#>
+    PREFIX gvp: <http://vocab.getty.edu/ontology#>
+    PREFIX xl: <http://www.w3.org/2008/05/skos-xl#>
+    PREFIX tgn: <http://vocab.getty.edu/tgn/>
+    PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
+"""
+
+_TGN_QUERY_NO_TYPE = Template(_TGN_QUERY_PREFIXES + """
+    SELECT DISTINCT ?p ?pLab ?context WHERE {
+        ?p skos:inScheme tgn:;
+            luc:term "$place";
+            gvp:prefLabelGVP [xl:literalForm ?pLab];
+            gvp:parentString ?context.
+
+        FILTER(CONTAINS(?context, "$country"))
+    }
+""")
+
+_TGN_QUERY_WITH_TYPE = Template(_TGN_QUERY_PREFIXES + """
+    SELECT DISTINCT ?p ?pLab ?context WHERE {
+        ?p skos:inScheme tgn:;
+            luc:term "$place";
+            gvp:prefLabelGVP [xl:literalForm ?pLab];
+            gvp:parentString ?context.
+
+        ?p gvp:placeType [rdfs:label "$type"@$lang].
+
+        FILTER(CONTAINS(?context, "$country"))
+    }
+""")
+
+_TGN_BATCH_QUERY_NO_TYPE = Template(_TGN_QUERY_PREFIXES + """
+    SELECT DISTINCT ?term ?p ?pLab ?context WHERE {
+        VALUES ?term { $values }
+        ?p skos:inScheme tgn:;
+            luc:term ?term;
+            gvp:prefLabelGVP [xl:literalForm ?pLab];
+            gvp:parentString ?context.
+
+        FILTER(CONTAINS(?context, "$country"))
+    }
+""")
+
+_TGN_BATCH_QUERY_WITH_TYPE = Template(_TGN_QUERY_PREFIXES + """
+    SELECT DISTINCT ?term ?p ?pLab ?context WHERE {
+        VALUES ?term { $values }
+        ?p skos:inScheme tgn:;
+            luc:term ?term;
+            gvp:prefLabelGVP [xl:literalForm ?pLab];
+            gvp:parentString ?context.
+
+        ?p gvp:placeType [rdfs:label "$type"@$lang].
+
+        FILTER(CONTAINS(?context, "$country"))
+    }
+""")
+
+
+# Search, coordinates, country and administrative entity of the places in a single
+# request to the Wikidata Query Service. $type_filter and $country_filter are
+# replaced by an empty string when no filter is requested.
+_WIKIDATA_QUERY = Template("""
+    SELECT ?item ?itemLabel ?coord ?country ?iso ?admin ?adminLabel ?ordinal WHERE {
+        SERVICE wikibase:mwapi {
+            bd:serviceParam wikibase:endpoint "www.wikidata.org";
+                            wikibase:api "EntitySearch";
+                            mwapi:search "$place";
+                            mwapi:language "$lang";
+                            mwapi:limit "10".
+            ?item wikibase:apiOutputItem mwapi:item.
+            ?ordinal wikibase:apiOrdinal true.
+        }
+        ?item wdt:P625 ?coord.
+        $type_filter
+        OPTIONAL { ?item wdt:P17 ?country. ?country wdt:P297 ?iso. }
+        OPTIONAL { ?item wdt:P131 ?admin. }
+        $country_filter
+        SERVICE wikibase:label { bd:serviceParam wikibase:language "$lang,en". }
+    }
+    ORDER BY ?ordinal
+""")
+
+# Coordinates on Earth are returned as "Point(lon lat)"; other globes are prefixed by their IRI
+_WKT_POINT = re.compile(r"^Point\(\s*(\S+)\s+(\S+)\s*\)$")
+
+
+_SPARQL_ESCAPE_RE = re.compile(r'[\\"\n\r]')
+_SPARQL_ESCAPES = {"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r"}
+
+
+def _sparql_escape(value: str) -> str:
+    """
+    Escape a value to be embedded in a double-quoted SPARQL string literal, so names
+    containing quotes or backslashes do not break the query.
+    """
+    return _SPARQL_ESCAPE_RE.sub(lambda match: _SPARQL_ESCAPES[match.group()], value)
+
+
+def _sparql_lang(lang: Optional[str]) -> str:
+    """
+    Reduce a language tag to letters and hyphens, so it can be used in a SPARQL language
+    tag or string. Defaults to English.
+    """
+    return re.sub(r"[^A-Za-z-]", "", lang or "") or "en"
+
+def _similarity_scores(place_name: str,
+                       choices: List[str],
+                       scorers: tuple = (fuzz.ratio,),
+                       score_cutoff: Optional[float] = None) -> List[float]:
+    """
+    Score every choice against the place name in a single batched call per scorer
+    and return, for each choice, the highest score among the scorers.
+    Strings are normalized once with `rapidfuzz.utils.default_process` (lowercase,
+    non-alphanumeric characters removed, whitespace trimmed) and reused by every scorer.
+    Scores below `score_cutoff` are returned as 0, as are names that are empty after
+    normalization.
+
+    If any choice is an exact match after normalization, fuzzy scoring is skipped:
+    exact matches score 100 and every other choice scores 0, so they always win.
+    """
+    if not choices:
+        return []
+
+    query = default_process(place_name)
+    if not query:
+        return [0.0] * len(choices)
+
+    processed_choices = [default_process(choice) for choice in choices]
+
+    if query in processed_choices:
+        return [100.0 if choice == query else 0.0 for choice in processed_choices]
+
+    # Names that are empty after normalization never match
+    indices = [i for i, choice in enumerate(processed_choices) if choice]
+    scores = [0.0] * len(choices)
+    if not indices:
+        return scores
+
+    rows = [
+        process.cdist([query], [processed_choices[i] for i in indices], scorer=scorer,
+                      score_cutoff=score_cutoff, dtype=float)[0].tolist()
+        for scorer in scorers
+    ]
+    for i, row_scores in zip(indices, zip(*rows)):
+        scores[i] = max(row_scores)
+    return scores
+
+
+@functools.lru_cache(maxsize=8)
+def _load_places_map_cached(path: Optional[str] = None) -> dict:
+    """
+    Parse a places mapping JSON file once per path. Without a path, the mapping
+    bundled with the package is loaded. The returned dictionary is shared; use
+    `PlaceResolver._load_places_map` to get a copy.
+    """
+    if path:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    return orjson.loads(files("georesolver").joinpath("data/mappings/places_map.json").read_bytes())
 
 
 class PlaceTypeMapper:
     def __init__(self, mapping: dict):
         self.mapping = mapping
+        # Flattened (place_type, service) -> service place type lookup
+        self._flat = {
+            (place_type.lower(), service): value
+            for place_type, services in mapping.items() if isinstance(services, dict)
+            for service, value in services.items()
+        }
 
     def get_for_service(self, place_type, service) -> Union[str, None]:
-        try:
-            return self.mapping[place_type.lower()][service]
-        except KeyError:
-            return None
+        return self._flat.get((place_type.lower(), service))
 
 
 class GeoNamesQuery(BaseQuery):
@@ -46,13 +221,14 @@ class GeoNamesQuery(BaseQuery):
     Attributes:
         endpoint (str): The base URL for the GeoNames API
         username (str): GeoNames API username for authentication
+        max_workers (int): Maximum number of concurrent requests in `places_by_names`
 
     Example:
         >>> geonames = GeoNamesQuery("http://api.geonames.org", username="your_username")
         >>> results = geonames.places_by_name("Madrid", country="ES")
         >>> coordinates = geonames.get_best_match(results, "Madrid")
     """
-    def __init__(self, geonames_username: Union[str, None] = None):
+    def __init__(self, geonames_username: Union[str, None] = None, max_workers: int = 8):
         super().__init__(base_url=GEONAMES_ENDPOINT)
         if geonames_username:
             self.username = geonames_username
@@ -60,8 +236,16 @@ class GeoNamesQuery(BaseQuery):
             self.username = os.getenv("GEONAMES_USERNAME")
         if not self.username:
             raise ValueError("GeoNames username must be provided either as an argument or via the GEONAMES_USERNAME environment variable.")
+        self.max_workers = max_workers
+        # Query of recent SHORT searches by their candidates, to fetch alternate names on demand
+        self._short_searches = LRUCache(maxsize=1024)
 
-    def places_by_name(self, place_name: str, country_code: Optional[str], place_type: Optional[str] = None, lang: Optional[str] = None) -> dict:
+    def places_by_name(self,
+                       place_name: str,
+                       country_code: Optional[str],
+                       place_type: Optional[str] = None,
+                       lang: Optional[str] = None,
+                       style: str = "SHORT") -> dict:
         """
         Search for places using the GeoNames API.
         
@@ -70,14 +254,17 @@ class GeoNamesQuery(BaseQuery):
             country_code (str): Optional ISO 3166-1 alpha-2 country code
             place_type (str): Optional feature class (A: country, P: city/village, etc.).
                               Additional types can be added in the data/mappings/geonames_place_map.json file.
+            lang (str): Optional ISO-639 language code. Place names are returned in this language.
+            style (str): Verbosity of the response. Defaults to "SHORT", which leaves out the
+                         alternate names; `get_best_match` requests them with "FULL" only when
+                         no candidate name is similar enough.
         """
 
         params = {
             'q': place_name,
-            'username': self.username,
             'maxRows': 10,
             'type': 'json',
-            'style': 'FULL'
+            'style': style
         }
         
         if country_code:
@@ -86,15 +273,45 @@ class GeoNamesQuery(BaseQuery):
         if place_type:
             params['featureClass'] = place_type.lower()
 
+        if lang:
+            params['lang'] = lang
+
+        results = self._search(params)
+        if style != "FULL" and results.get("geonames"):
+            self._short_searches.set(self._candidates_key(results["geonames"]), params)
+        return results
+
+    @staticmethod
+    def _candidates_key(geonames: list) -> tuple:
+        return tuple(place.get("geonameId") for place in geonames)
+
+    def _search(self, params: dict) -> dict:
         try:
             response = self._limited_get(
                 "/searchJSON",
-                params=params
+                params={**params, 'username': self.username}
             )
-            return response.json()
+            return orjson.loads(response.content)
         except Exception as e:
-            self.logger.error(f"Error querying GeoNames for '{place_name}': {str(e)}")
+            self.logger.error(f"Error querying GeoNames for '{params.get('q')}': {str(e)}")
             return {"geonames": []}
+
+    def places_by_names(self,
+                        place_names: List[str],
+                        country_code: Optional[str],
+                        place_type: Optional[str] = None,
+                        lang: Optional[str] = None) -> Dict[str, Union[dict, list]]:
+        """
+        Search for several places concurrently. GeoNames has no batch search,
+        so one request per name is sent from a pool of worker threads.
+        """
+        names = list(dict.fromkeys(place_names))
+        if not names:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(names))) as executor:
+            results = executor.map(lambda name: self.places_by_name(name, country_code, place_type, lang=lang), names)
+            return dict(zip(names, results))
         
     def _post_filtering(
         self,
@@ -112,10 +329,11 @@ class GeoNamesQuery(BaseQuery):
         if lang:
             self.logger.info(f"Post-filtering GeoNames results for '{place_name}' with language '{lang}'")
 
-            standardize_label = next((name for name in results.get("alternateNames", []) if name["lang"] == lang), {}).get("name", "")
+            standardize_label = next((name for name in results.get("alternateNames", []) if name.get("lang") == lang), {}).get("name", "")
 
             if not standardize_label:
-                standardize_label = results["toponymName"]
+                # Searches with `lang` return the name in that language
+                standardize_label = results.get("name") or results["toponymName"]
 
         return {
                 "place": place_name,
@@ -159,26 +377,43 @@ class GeoNamesQuery(BaseQuery):
             result = geonames[0]
             return self._post_filtering(result, place_name, fuzzy_threshold, 100, lang)
 
-        best_ratio = 0
-        best_coords = None
-        
+        match = self._match_names(geonames, place_name, fuzzy_threshold, lang)
+        short_search = self._short_searches.get(self._candidates_key(geonames)) if match is None else None
+        if short_search is not None:
+            # No name matched: fetch the alternate names of the candidates and try again
+            self.logger.info(f"No GeoNames name matched '{place_name}', retrying with alternate names")
+            full_results = self._search({**short_search, "style": "FULL"})
+            if full_results.get("geonames"):
+                match = self._match_names(full_results["geonames"], place_name, fuzzy_threshold, lang)
+        return match
+
+    def _match_names(self, geonames: list, place_name: str, fuzzy_threshold: float, lang: Optional[str] = None) -> Union[dict, None]:
+        """
+        Score the names (and alternate names, if present) of all candidates and return
+        the post-filtered best match, or None if no name reaches the threshold.
+        """
+        # Flatten the names of all candidates so they are scored in one batch
+        all_names = []
+        owners = []
         for place in geonames:
-            name = place.get("name", "")
-            alternate_names = place.get("alternateNames", [])
-            all_names = [name] + [n.get("name", "") for n in alternate_names]
-            
-            for n in all_names:
-                partial_ratio = fuzz.partial_ratio(place_name.lower(), n.lower())
-                regular_ratio = fuzz.ratio(place_name.lower(), n.lower())
-                ratio = max(partial_ratio, regular_ratio)
-                
-                if ratio > best_ratio:
-                    best_ratio = ratio
-                    best_coords = self._post_filtering(place, place_name, fuzzy_threshold, ratio, lang)
-                    self.logger.info(f"Found match: '{name}' with similarity {ratio}%")
+            names = dict.fromkeys([place.get("name", ""), place.get("toponymName", "")]
+                                  + [n.get("name", "") for n in place.get("alternateNames", [])])
+            all_names.extend(names)
+            owners.extend([place] * len(names))
+
+        scores = _similarity_scores(place_name, all_names,
+                                    scorers=(fuzz.partial_ratio, fuzz.ratio),
+                                    score_cutoff=fuzzy_threshold)
+        if not scores:
+            return None
 
-        if best_ratio >= fuzzy_threshold:
-            return best_coords
+        best_index = max(range(len(scores)), key=scores.__getitem__)
+        best_ratio = scores[best_index]
+
+        if best_ratio and best_ratio >= fuzzy_threshold:
+            place = owners[best_index]
+            self.logger.info(f"Found match: '{place.get('name', '')}' with similarity {best_ratio}%")
+            return self._post_filtering(place, place_name, fuzzy_threshold, best_ratio, lang)
         
         return None
 
@@ -234,7 +469,7 @@ class WHGQuery(BaseQuery):
 
         try:
             response = self._limited_get(url)
-            results = response.json()
+            results = orjson.loads(response.content)
             if country_code:
                 return self._post_filtering_search(results, country_code=country_code)
             return results
@@ -253,20 +488,22 @@ class WHGQuery(BaseQuery):
                        lang: Optional[str] = None) -> Union[dict, None]:
 
         self.logger.info(f"Finding best match for '{place_name}' in WHG results")
-        self.logger.debug(f"Results: {results}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Results: {results}")
 
         try:
             features = results.get("features", []) if isinstance(results, dict) else []
             if not features:
                 return None
 
-            for r in features:
-                name = r.get("properties", {}).get("title", "")
-                if not name:
-                    continue
-                
-                ratio = fuzz.ratio(name.lower(), place_name.lower())
-                self.logger.info(f"Comparing '{name}' with '{place_name}': {ratio}% similarity")
+            candidates = [r for r in features if r.get("properties", {}).get("title", "")]
+            names = [r["properties"]["title"] for r in candidates]
+            scores = _similarity_scores(place_name, names, score_cutoff=fuzzy_threshold)
+
+            log_candidates = self.logger.isEnabledFor(logging.INFO)
+            for r, name, ratio in zip(candidates, names, scores):
+                if log_candidates:
+                    self.logger.info(f"Comparing '{name}' with '{place_name}': {ratio}% similarity")
                 if ratio >= fuzzy_threshold:
                     return self._post_filtering(
                         results=r,
@@ -339,7 +576,8 @@ class WHGQuery(BaseQuery):
         """
         Returns the dictionary customized to the WHG API results.
         """
-        self.logger.debug(f"Post-filtering WHG results for '{place_name}' with language '{lang}'\n{results}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Post-filtering WHG results for '{place_name}' with language '{lang}'\n{results}")
 
         geometry = results.get("geometry", {})
         coordinates = self.get_coordinates_lod_json(geometry, place_name)
@@ -372,8 +610,7 @@ class TGNQuery(BaseQuery):
     and filtering by country and place type.
 
     Attributes:
-        sparql (SPARQLWrapper): SPARQL endpoint wrapper instance for TGN queries
-        lang (str): Language code for the place type (default: "en")
+        batch_size (int): Maximum number of place names searched in a single query by `places_by_names`
 
     Example:
         >>> tgn = TGNQuery("http://vocab.getty.edu/sparql")
@@ -381,12 +618,12 @@ class TGNQuery(BaseQuery):
         >>> coordinates = tgn.get_best_match(results, "Madrid")
     """
     def __init__(self):
-        super().__init__(base_url=TGN_ENDPOINT)
-        self.sparql = SPARQLWrapper(self.base_url)
-        self.sparql.setReturnFormat(JSON)
+        # The full-text search of the TGN endpoint can take a while
+        super().__init__(base_url=TGN_ENDPOINT, timeout=30)
+        self._lod_cache = LRUCache(maxsize=4096)
+        self._query_cache = LRUCache(maxsize=1024, ttl=3600)
+        self.batch_size = 50
 
-    @sleep_and_retry
-    @limits(calls=10, period=1)
     def places_by_name(self, place_name: str, country_code: Optional[str], place_type: Optional[str] = None, lang: Optional[str] = "en") -> Union[dict, list]:
         """
         Search for places using the TGN SPARQL endpoint.
@@ -396,47 +633,37 @@ class TGNQuery(BaseQuery):
             country_code (str): Country code or name
             place_type (str): Optional type of place (e.g., 'ciudad', 'pueblo')
         """
-
-        country_name = ""
-
-        if country_code:
-            country = pycountry.countries.get(alpha_2=country_code)
-            if country:
-                country_name = country.name
-            else:
-                country_name = country_code
-
-        type_filter = f'?p gvp:placeType [rdfs:label "{place_type}"@{lang}].' if place_type else ''
-
-        query = f"""
-            PREFIX skos: <http://www.w3.org/2004/02/skos/core#>
-            PREFIX luc: <http://www.ontotext.com/owlim/lucene#>
-            PREFIX gvp: <http://vocab.getty.edu/ontology#>
-            PREFIX xl: <http://www.w3.org/2008/05/skos-xl#>
-            PREFIX tgn: <http://vocab.getty.edu/tgn/>
-            PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-
-            SELECT DISTINCT ?p ?pLab ?context WHERE {{
-                ?p skos:inScheme tgn:;
-                    luc:term "{place_name}";
-                    gvp:prefLabelGVP [xl:literalForm ?pLab];
-                    gvp:parentString ?context.
-
-                {type_filter}
-                
-                FILTER(CONTAINS(?context, "{country_name}"))
-            }}
-        """
+        lang = _sparql_lang(lang)
+
+        cache_key = (place_name, country_code, place_type, lang)
+        cached = self._query_cache.get(cache_key)
+        if cached is not None:
+            self.logger.info(f"[CACHE HIT] TGN query for '{place_name}'")
+            return cached
+
+        country_name = self._country_name(country_code)
+
+        template = _TGN_QUERY_WITH_TYPE if place_type else _TGN_QUERY_NO_TYPE
+        query = template.substitute(
+            place=_sparql_escape(place_name),
+            country=_sparql_escape(country_name),
+            type=_sparql_escape(place_type or ""),
+            lang=lang
+        )
         
-        self.logger.debug(f"Executing SPARQL {query} for TGN with place name '{place_name}' and country code '{country_code}'")
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self.logger.debug(f"Executing SPARQL {query} for TGN with place name '{place_name}' and country code '{country_code}'")
 
         try:
-            self.sparql.setQuery(query)
-            results = self.sparql.query().convert()
-            self.logger.debug(f"SPARQL query results for '{place_name}': {results}")
+            results = self._run_query(query)
+            if debug:
+                self.logger.debug(f"SPARQL query results for '{place_name}': {results}")
 
             if isinstance(results, dict) and "results" in results and "bindings" in results["results"]:
-                return results["results"]["bindings"]
+                bindings = results["results"]["bindings"]
+                self._query_cache.set(cache_key, bindings)
+                return bindings
             else:
                 self.logger.error(f"Unexpected SPARQL result format for '{place_name}': {results}")
                 return []
@@ -444,15 +671,111 @@ class TGNQuery(BaseQuery):
             self.logger.error(f"Error querying TGN for '{place_name}': {str(e)}")
             return []
 
+    def places_by_names(self,
+                        place_names: List[str],
+                        country_code: Optional[str],
+                        place_type: Optional[str] = None,
+                        lang: Optional[str] = "en") -> Dict[str, Union[dict, list]]:
+        """
+        Search for several places with a single SPARQL query per `batch_size` names,
+        using a VALUES clause. The bindings are grouped back by the searched name.
+
+        Parameters:
+            place_names (List[str]): Names of the places to search for
+            country_code (str): Country code or name
+            place_type (str): Optional type of place (e.g., 'ciudad', 'pueblo')
+        """
+        lang = _sparql_lang(lang)
+        results = {}
+        missing_names = []
+        for name in dict.fromkeys(place_names):
+            cached = self._query_cache.get((name, country_code, place_type, lang))
+            if cached is not None:
+                results[name] = cached
+            else:
+                missing_names.append(name)
+
+        country_name = self._country_name(country_code)
+        template = _TGN_BATCH_QUERY_WITH_TYPE if place_type else _TGN_BATCH_QUERY_NO_TYPE
+
+        for i in range(0, len(missing_names), self.batch_size):
+            chunk = missing_names[i:i + self.batch_size]
+            query = template.substitute(
+                values=" ".join('"' + _sparql_escape(name) + '"' for name in chunk),
+                country=_sparql_escape(country_name),
+                type=_sparql_escape(place_type or ""),
+                lang=lang
+            )
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Executing batch SPARQL {query} for TGN with {len(chunk)} place names")
+
+            try:
+                bindings = self._run_query(query)["results"]["bindings"]
+            except Exception as e:
+                self.logger.error(f"Error querying TGN for {chunk}: {str(e)}")
+                results.update({name: [] for name in chunk})
+                continue
+
+            grouped = {name: [] for name in chunk}
+            for binding in bindings:
+                term = binding.get("term", {}).get("value")
+                if term in grouped:
+                    grouped[term].append(binding)
+
+            for name, name_bindings in grouped.items():
+                self._query_cache.set((name, country_code, place_type, lang), name_bindings)
+                results[name] = name_bindings
+
+        return results
+
+    def _country_name(self, country_code: Optional[str]) -> str:
+        """
+        Return the English name of the country used to filter the TGN parent string.
+        """
+        if not country_code:
+            return ""
+        country = pycountry.countries.get(alpha_2=country_code)
+        return country.name if country else country_code
+
+    @sleep_and_retry
+    @limits(calls=10, period=1)
+    def _run_query(self, query: str) -> dict:
+        """
+        Execute a SPARQL query against the TGN endpoint and return the decoded JSON results.
+        """
+        response = self._limited_post(self.base_url,
+                                      data={"query": query},
+                                      headers={"Accept": "application/sparql-results+json"})
+        return orjson.loads(response.content)
+
     def get_coordinates_lod_json(self, data: dict) -> dict:
-        
-        for item in data.get("identified_by", []):
-            if item.get("type") == "crm:E47_Spatial_Coordinates":
-                coords = ast.literal_eval(item.get("value"))
-                if isinstance(coords, list) and len(coords) == 2:
-                    lon, lat = coords
-                    return {"latitude": lat, "longitude": lon}
+        """
+        Extracts the coordinates from a TGN LOD JSON record. The value of the
+        spatial coordinates identifier is a JSON array in the form "[lon, lat]".
+        """
+        item = next((i for i in data.get("identified_by", []) if i.get("type") == "crm:E47_Spatial_Coordinates"), None)
+        if item is not None:
+            try:
+                coords = orjson.loads(item.get("value"))
+            except (orjson.JSONDecodeError, TypeError):
+                self.logger.warning(f"Invalid coordinates value in TGN record: {item.get('value')}")
+                coords = None
+            if isinstance(coords, list) and len(coords) == 2:
+                lon, lat = coords
+                return {"latitude": lat, "longitude": lon}
         return {"latitude": None, "longitude": None}
+
+    def _fetch_lod_json(self, tgn_uri: str) -> dict:
+        """
+        Fetch the linked open data JSON record of a TGN place, using the in-memory cache when possible.
+        """
+        cached = self._lod_cache.get(tgn_uri)
+        if cached is not None:
+            return cached
+        response = self._limited_get(tgn_uri + ".json")
+        results = orjson.loads(response.content)
+        self._lod_cache.set(tgn_uri, results)
+        return results
         
     def _post_filtering(
         self,
@@ -462,10 +785,8 @@ class TGNQuery(BaseQuery):
         confidence: float,
         lang: Optional[str] = "en") -> dict:
 
-        json_url = tgn_uri + ".json"
         try:
-            response = self._limited_get(json_url)
-            results = response.json()
+            results = self._fetch_lod_json(tgn_uri)
         except Exception as e:
             self.logger.error(f"Error fetching TGN data for {place_name}: {e}")
             return {}
@@ -473,7 +794,7 @@ class TGNQuery(BaseQuery):
         coordinates = self.get_coordinates_lod_json(results)
         if coordinates["latitude"] is None or coordinates["longitude"] is None:
             self.logger.warning(f"No valid coordinates found for {place_name} in TGN results.")
-
+            return {}
 
         return {
                 "place": place_name,
@@ -497,7 +818,8 @@ class TGNQuery(BaseQuery):
             self.logger.debug(f"No results found for '{place_name}' in TGN.")
             return None
 
-        self.logger.debug(f"Finding best match for '{place_name}' in TGN {results}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Finding best match for '{place_name}' in TGN {results}")
 
         if len(results) == 1:
             return self._post_filtering(results[0].get("p", {}).get("value", ""),
@@ -506,11 +828,14 @@ class TGNQuery(BaseQuery):
                                         confidence=100,
                                         lang=lang)
 
-        for r in results:
-            label = r.get("pLab", {}).get("value", "")
+        labels = [r.get("pLab", {}).get("value", "") for r in results]
+        scores = _similarity_scores(place_name, labels, score_cutoff=fuzzy_threshold)
+
+        log_candidates = self.logger.isEnabledFor(logging.INFO)
+        for r, label, ratio in zip(results, labels, scores):
             uri = r.get("p", {}).get("value", "")
-            ratio = fuzz.ratio(label.lower(), place_name.lower())
-            self.logger.info(f"Comparing '{label}' with '{place_name} {uri}': {ratio}% similarity")
+            if log_candidates:
+                self.logger.info(f"Comparing '{label}' with '{place_name} {uri}': {ratio}% similarity")
             if ratio >= fuzzy_threshold:
                 self.logger.info(f"Best match for '{place_name}': {label} ({ratio}%)")
                 return self._post_filtering(uri,
@@ -525,15 +850,26 @@ class TGNQuery(BaseQuery):
 
 class WikidataQuery(BaseQuery):
     """
-    A class to interact with the Wikidata MediaWiki API for geographic coordinates lookup.
+    A class to interact with the Wikidata Query Service (SPARQL) for geographic coordinates lookup.
+
+    The search, coordinates (P625), country (P17/P297) and administrative entity (P131)
+    of the candidates are retrieved with a single SPARQL query that uses the
+    MediaWiki API EntitySearch service.
+
+    Attributes:
+        sparql_endpoint (str): The Wikidata Query Service endpoint
+
+    Example:
+        >>> wikidata = WikidataQuery()
+        >>> results = wikidata.places_by_name("New York", "US", "Q515")
+        >>> coordinates = wikidata.get_best_match(results, "New York", fuzzy_threshold=90)
     """
 
-    def __init__(self,
-                 search_endpoint=WIKIDATA_ENDPOINT,
-                 entitydata_endpoint=ENTITYDATA_ENDPOINT):
-        super().__init__(base_url=search_endpoint)
-        self.search_endpoint = search_endpoint
-        self.entitydata_endpoint = entitydata_endpoint
+    def __init__(self, sparql_endpoint=WIKIDATA_ENDPOINT):
+        super().__init__(base_url=sparql_endpoint)
+        self.sparql_endpoint = sparql_endpoint
+        # The Wikidata Query Service asks clients to identify themselves
+        self.session.headers["User-Agent"] = "GeoResolver (https://github.com/jairomelo/Georesolver)"
 
     @sleep_and_retry
     @limits(calls=30, period=1)
@@ -542,183 +878,80 @@ class WikidataQuery(BaseQuery):
                        country_code: Optional[str], 
                        place_type: Optional[str] = None,
                        lang: Optional[str] = "en") -> Union[dict, list]:
-        
-        params = {
-            "action": "wbsearchentities",
-            "search": place_name,
-            "language": lang,
-            "format": "json",
-            "type": "item",
-            "limit": 10
-        }
+        """
+        Search for places using the Wikidata Query Service.
+
+        Parameters:
+            place_name (str): Name of the place to search for
+            country_code (str): ISO 3166-1 alpha-2 country code
+            place_type (str): Optional Wikidata class QID (P31) of the place (e.g., 'Q515' for city)
+            lang (str): Language of the search and of the labels
+        """
+        lang = _sparql_lang(lang)
+
+        type_filter = ""
+        if place_type:
+            if re.fullmatch(r"Q\d+", place_type):
+                type_filter = f"?item wdt:P31 wd:{place_type}."
+            else:
+                self.logger.warning(f"Ignoring place_type '{place_type}' for Wikidata: it must be a class QID (e.g. 'Q515').")
+
+        query = _WIKIDATA_QUERY.substitute(
+            place=_sparql_escape(place_name),
+            lang=lang,
+            type_filter=type_filter,
+            country_filter=f'FILTER(?iso = "{re.sub(r"[^A-Za-z]", "", country_code).upper()}")' if country_code else ""
+        )
 
         try:
-            response = self._limited_get(self.search_endpoint, params=params)
-            search_results = response.json().get("search", [])
-            self.logger.debug(f"Wikidata search results for '{place_name}': {search_results}")
+            response = self._limited_get(self.sparql_endpoint, params={"query": query, "format": "json"})
+            bindings = orjson.loads(response.content)["results"]["bindings"]
         except Exception as e:
             self.logger.error(f"Error querying Wikidata for '{place_name}': {e}")
             return []
 
-        if not search_results:
-            return []
-
-        qids = [result.get("id") for result in search_results if result.get("id")]
-        self.logger.debug(f"Found {len(qids)} QIDs for '{place_name}': {qids}")
-        if not qids:
-            return []
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Wikidata results for '{place_name}': {bindings}")
 
-        # Batch fetch entity data for all QIDs
-        entities_data = self._batch_fetch_entities(qids)
-        
-        # Extract all country QIDs and administrative entity QIDs to batch fetch them too
-        country_qids = set()
-        admin_qids = set()
-        for qid in entities_data:
-            claims = entities_data[qid].get("claims", {})
-            try:
-                country_qid = claims.get("P17", [])[0]["mainsnak"]["datavalue"]["value"]["id"]
-                country_qids.add(country_qid)
-            except (IndexError, KeyError):
-                pass
-            try:
-                admin_qid = claims.get("P131", [])[0]["mainsnak"]["datavalue"]["value"]["id"]
-                admin_qids.add(admin_qid)
-            except (IndexError, KeyError):
-                pass
-        
-        # Batch fetch country and administrative entity data
-        country_data = {}
-        admin_data = {}
-        if country_qids:
-            country_data = self._batch_fetch_entities(list(country_qids))
-        if admin_qids:
-            admin_data = self._batch_fetch_entities(list(admin_qids))
-           
+        # An item appears once per combination of its values (several coordinates,
+        # countries, ...); keep the first row of each item, in search order.
         enriched_results = []
-        for result in search_results:
-            qid = result.get("id")
-            label = result.get("label", "")
-            
-            if qid not in entities_data:
+        seen = set()
+        for binding in bindings:
+            qid = binding["item"]["value"].rsplit("/", 1)[-1]
+            if qid in seen:
                 continue
-                
-            entity_data = entities_data[qid]
-            claims = entity_data.get("claims", {})
-            
-            coords = self._extract_coordinates(claims)
-            if not coords or coords == (None, None):
-                continue
-
-            # Get country info for this place
-            place_country_qid, place_country_iso = self._get_place_country_info(claims, country_data)
 
-            # Get administrative entity info for this place
-            admin_qid, admin_label = self._get_place_admin_info(claims, admin_data, lang)
-
-            if country_code and not self._match_country_optimized(place_country_iso, country_code):
-                continue
-
-            if place_type and not self._match_place_type(claims, place_type):
+            coords = self._parse_coordinates(binding.get("coord", {}).get("value", ""))
+            if coords is None:
                 continue
+            seen.add(qid)
 
-            # Store all needed data for post-filtering
+            admin_qid = binding.get("admin", {}).get("value", "").rsplit("/", 1)[-1]
             enriched_results.append({
-                "label": label,
+                "label": binding.get("itemLabel", {}).get("value", ""),
                 "qid": qid,
                 "coordinates": coords,
-                "entity_data": entity_data,
-                "claims": claims,
-                "country_qid": place_country_qid,
-                "country_iso": place_country_iso,
+                "country_qid": binding.get("country", {}).get("value", "").rsplit("/", 1)[-1],
+                "country_iso": binding.get("iso", {}).get("value", "").upper(),
                 "admin_qid": admin_qid,
-                "admin_label": admin_label
+                "admin_label": binding.get("adminLabel", {}).get("value", "") if admin_qid else ""
             })
 
         return enriched_results
 
-    def _batch_fetch_entities(self, qids: List[str]) -> Dict[str, dict]:
+    def _parse_coordinates(self, wkt: str) -> Union[tuple, None]:
         """
-        Batch fetch entity data for multiple QIDs using wbgetentities API.
-        This significantly reduces the number of HTTP requests compared to individual fetches.
+        Parse a WKT "Point(lon lat)" literal into a (lat, lon) tuple.
         """
-        entities_data = {}
-        
-        # Process QIDs in chunks of 50 (Wikidata API limit)
-        chunk_size = 50
-        for i in range(0, len(qids), chunk_size):
-            chunk = qids[i:i + chunk_size]
-            
-            params = {
-                "action": "wbgetentities",
-                "ids": "|".join(chunk),
-                "format": "json",
-                "props": "labels|claims"  # Only fetch what we need
-            }
-            
-            try:
-                response = self._limited_get(self.search_endpoint, params=params)
-                result = response.json()
-                
-                if "entities" in result:
-                    entities_data.update(result["entities"])
-                    
-            except Exception as e:
-                self.logger.warning(f"Failed to batch fetch entities {chunk}: {e}")
-                # Fallback to individual fetching for this chunk
-                for qid in chunk:
-                    entity_data = self._fetch_entity_data(qid)
-                    if entity_data:
-                        entities_data[qid] = entity_data
-        
-        return entities_data
-
-    def _get_place_country_info(self, claims: dict, country_data: Dict[str, dict]) -> tuple:
-        """
-        Extract country QID and ISO code for a place using pre-fetched country data.
-        Returns (country_qid, country_iso_code)
-        """
-        try:
-            country_qid = claims.get("P17", [])[0]["mainsnak"]["datavalue"]["value"]["id"]
-            if country_qid in country_data:
-                country_claims = country_data[country_qid].get("claims", {})
-                iso_code = country_claims.get("P297", [{}])[0].get("mainsnak", {}).get("datavalue", {}).get("value", "")
-                return country_qid, iso_code.upper() if iso_code else ""
-            return country_qid, ""
-        except (IndexError, KeyError):
-            return "", ""
-
-    def _get_place_admin_info(self, claims: dict, admin_data: Dict[str, dict], lang: Optional[str]) -> tuple:
-        """
-        Extract administrative entity QID and label for a place using pre-fetched admin data.
-        Returns (admin_qid, admin_label)
-        """
-        try:
-            admin_qid = claims.get("P131", [])[0]["mainsnak"]["datavalue"]["value"]["id"]
-            if admin_qid in admin_data and lang:
-                admin_labels = admin_data[admin_qid].get("labels", {})
-                admin_label = admin_labels.get(lang, {}).get("value", "")
-                return admin_qid, admin_label
-            return admin_qid, ""
-        except (IndexError, KeyError):
-            return "", ""
-
-    def _match_country_optimized(self, place_country_iso: str, target_country_code: str) -> bool:
-        """
-        Optimized country matching using pre-extracted ISO codes.
-        """
-        if not place_country_iso or not target_country_code:
-            return False
-        return place_country_iso.upper() == target_country_code.upper()
-
-    def _fetch_entity_data(self, qid: str) -> dict:
+        match = _WKT_POINT.match(wkt)
+        if not match:
+            return None
         try:
-            url = f"{self.entitydata_endpoint}{qid}.json"
-            response = self._limited_get(url)
-            return response.json()["entities"][qid]
-        except Exception as e:
-            self.logger.warning(f"Failed to fetch entity data for {qid}: {e}")
-            return {}
+            lon, lat = float(match.group(1)), float(match.group(2))
+        except ValueError:
+            return None
+        return lat, lon
 
     def get_best_match(self, 
                        results: Union[dict, list], 
@@ -731,15 +964,15 @@ class WikidataQuery(BaseQuery):
         best_score = 0
         best_result = None
 
-        for result in results:
-            label = result["label"]
-            score = max(fuzz.ratio(label.lower(), place_name.lower()),
-                        fuzz.partial_ratio(label.lower(), place_name.lower()))
+        scores = _similarity_scores(place_name, [result["label"] for result in results],
+                                    scorers=(fuzz.ratio, fuzz.partial_ratio),
+                                    score_cutoff=fuzzy_threshold)
 
+        for result, score in zip(results, scores):
             if score > best_score and score >= fuzzy_threshold:
                 best_score = score
                 best_result = result
-                self.logger.info(f"Wikidata match: '{label}' → {score}%")
+                self.logger.info(f"Wikidata match: '{result['label']}' → {score}%")
 
         if best_result:
             return self._post_filtering(
@@ -759,14 +992,12 @@ class WikidataQuery(BaseQuery):
                        confidence: float,
                        lang: Optional[str] = "en") -> dict:
         """
-        Returns the dictionary customized to the Wikidata API results.
+        Returns the dictionary customized to the Wikidata Query Service results.
         """
         qid = results.get("qid", "")
         label = results.get("label", "")
         coords = results.get("coordinates", (None, None))
-        entity_data = results.get("entity_data", {})
-        claims = results.get("claims", {})
-        
+
         # Use pre-extracted country and administrative entity information
         country_code = results.get("country_iso", "")
         admin_qid = results.get("admin_qid", "")
@@ -792,34 +1023,6 @@ class WikidataQuery(BaseQuery):
             "match_type": "exact" if confidence == 100 else "fuzzy"
         }
 
-    def _extract_coordinates(self, claims: dict) -> tuple:
-        try:
-            coord_data = claims.get("P625", [])[0]["mainsnak"]["datavalue"]["value"]
-            return coord_data["latitude"], coord_data["longitude"]
-        except Exception:
-            return (None, None)
-
-    def _match_country(self, claims: dict, iso_code: str) -> bool:
-        # DEPRECATED: Use _match_country_optimized instead
-        # This method is kept for backward compatibility but should not be used
-        # in the optimized workflow as it makes individual HTTP requests
-        try:
-            country_entity = claims.get("P17", [])[0]["mainsnak"]["datavalue"]["value"]["id"]
-            url = f"{self.entitydata_endpoint}{country_entity}.json"
-            response = self._limited_get(url)
-            country_data = response.json()
-            wikidata_iso = country_data["entities"][country_entity]["claims"]["P297"][0]["mainsnak"]["datavalue"]["value"]
-            return wikidata_iso.upper() == iso_code.upper()
-        except Exception:
-            return False
-
-    def _match_place_type(self, claims: dict, expected_qid: str) -> bool:
-        try:
-            types = [c["mainsnak"]["datavalue"]["value"]["id"] for c in claims.get("P31", [])]
-            return expected_qid in types
-        except Exception:
-            return False
-
         
 class PlaceResolver:
     """
@@ -835,6 +1038,18 @@ class PlaceResolver:
             flexible_threshold_value (float): The threshold value to use when flexible_threshold is True.
                                                 If no value is provided, it defaults to 70.
             verbose (bool): If True, enable verbose logging.
+            cache_size (int): Maximum number of resolved places kept in memory. Repeated calls
+                              with the same arguments are answered from this cache.
+            enable_cache (bool): If True, store resolved places in a persistent SQLite cache, so
+                                 they are not requested again in later sessions.
+            cache_name (str): Name of the SQLite cache file (without the .sqlite extension).
+            cache_expiry (int): Number of seconds a resolved place is kept in the persistent cache.
+            parallel (bool): If True, query all services concurrently instead of one after another.
+                             The service order is still respected.
+            priority_window (Optional[float]): When querying in parallel, the maximum number of seconds
+                                               to wait for higher-priority services once a lower-priority
+                                               service has found a match. If None (default), always wait,
+                                               so the result is the same as when querying sequentially.
 
     """
     def __init__(self, 
@@ -844,7 +1059,13 @@ class PlaceResolver:
                  threshold: float = 90,
                  flexible_threshold: bool = False,
                  flexible_threshold_value: float = 70, 
-                 verbose: bool = False):
+                 verbose: bool = False,
+                 cache_size: int = 4096,
+                 enable_cache: bool = True,
+                 cache_name: str = "resolved_cache",
+                 cache_expiry: int = 2592000,  # 30 days
+                 parallel: bool = True,
+                 priority_window: Optional[float] = None):
 
         self.logger = setup_logger(self.__class__.__name__, verbose)
         
@@ -857,7 +1078,10 @@ class PlaceResolver:
             ]
 
         self.services = services
+        self._resolved_cache = LRUCache(maxsize=cache_size)
         self.places_map = self._load_places_map(places_map_json)
+        # Keys used for each service in the places map, e.g. GeoNamesQuery -> "geonames"
+        self._service_keys = [type(service).__name__.removesuffix("Query").lower() for service in self.services]
         self.lang = lang if lang else "en"
 
         if not (0 <= threshold <= 100):
@@ -871,22 +1095,59 @@ class PlaceResolver:
                 raise ValueError("flexible_threshold_value must be between 0 and 100")
             
             self.flexible_threshold_value = flexible_threshold_value
-        
-        
+
+        self.parallel = parallel
+        if priority_window is not None and priority_window < 0:
+            raise ValueError("priority_window must be a non-negative number of seconds")
+        self.priority_window = priority_window
+        # Shared by all `resolve` calls, so concurrent lookups reuse a bounded set of threads
+        self._executor = None
+        if self.parallel and len(self.services) > 1:
+            self._executor = ThreadPoolExecutor(max_workers=4 * len(self.services),
+                                                thread_name_prefix="PlaceResolver")
+
+        self._persistent_cache = None
+        if enable_cache:
+            self._persistent_cache = ResolvedCache(f"{cache_name}.sqlite", expire_after=cache_expiry)
+            self.logger.info(f"Using resolved places cache '{cache_name}' (expires after {cache_expiry}s)")
+
+        # Results depend on these settings, so they are part of the persistent cache key
+        self._cache_settings = "|".join([
+            ",".join(service.__class__.__name__ for service in self.services),
+            self.lang,
+            str(self.threshold),
+            str(self.flexible_threshold_value) if self.flexible_threshold else ""
+        ])
 
         for service in self.services:
             service.logger = setup_logger(service.__class__.__name__, verbose)
             self.logger.debug(f"Updated logger for {service.__class__.__name__} with verbose={verbose}")
 
+    @property
+    def places_map(self) -> dict:
+        """
+        The place types mapping used to filter the services. The lookup table is built
+        when a mapping is assigned, so assign a new mapping to change it; changing the
+        returned dictionary in place has no effect.
+        """
+        return self._places_map
+
+    @places_map.setter
+    def places_map(self, mapping: dict) -> None:
+        self._places_map = mapping
+        self._mapper = PlaceTypeMapper(mapping)
+        self._places_map_digest = hashlib.sha1(orjson.dumps(mapping, option=orjson.OPT_SORT_KEYS)).hexdigest()
+        # Results resolved with the previous mapping are no longer valid
+        self._resolved_cache.clear()
+
+    @property
+    def _cache_config(self) -> str:
+        return f"{self._cache_settings}|{self._places_map_digest}"
+
     def _load_places_map(self, custom_path=None):
         try:
-            if custom_path:
-                with open(custom_path, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            else:
-                resource_path = files("georesolver").joinpath("data/mappings/places_map.json")
-                with resource_path.open("r", encoding="utf-8") as f:
-                    return json.load(f)
+            # Copy the shared mapping so changes to `places_map` stay in this resolver
+            return copy.deepcopy(_load_places_map_cached(custom_path))
         except Exception as e:
             self.logger.error(f"Error loading places map: {e}")
             return {}
@@ -910,10 +1171,136 @@ class PlaceResolver:
         Returns:
             tuple: (lat, lon) or (None, None) if not found
         """
+        return self._resolve(place_name, country_code, place_type, use_default_filter)
+
+    def _resolve(self,
+                 place_name: str,
+                 country_code: Union[str, None] = None,
+                 place_type: Union[str, None] = None,
+                 use_default_filter: bool = False,
+                 pending_writes: Optional[deque] = None,
+                 executor: Optional[ThreadPoolExecutor] = None) -> Union[dict, None]:
+        """
+        Implementation of `resolve`. If `pending_writes` is given, new results are appended
+        to it instead of being written to the persistent cache right away. If `executor` is
+        given, the services are queried from it instead of the resolver's thread pool.
+        """
+        place_name, country_code = self._validate_input(place_name, country_code)
+        if place_name is None:
+            return None
+
+        cache_key = (place_name, country_code, place_type, use_default_filter)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+
+        threshold = self._get_threshold(place_name)
+
+        result = self._query_services(place_name, country_code, place_type, threshold, use_default_filter, executor)
+        if result:
+            self._set_cached(cache_key, result, pending_writes)
+            return result
+        self.logger.warning(f"Could not resolve '{place_name}' via any service.")
+        return None
+
+    async def resolve_async(self,
+                            place_name: str,
+                            country_code: Union[str, None] = None,
+                            place_type: Union[str, None] = None,
+                            use_default_filter: bool = False) -> Union[dict, None]:
+        """
+        Asynchronous version of `resolve`. The lookup runs in a worker thread, so several
+        places can be resolved concurrently from an event loop.
+
+        Args:
+            place_name (str): The place name to search
+            country_code (str): ISO 3166-1 alpha-2 country code (optional)
+            place_type (str): Place type (optional)
+            use_default_filter (bool): If True, apply a default filter as fallback in case the place_type is not found.
+
+        Returns:
+            dict: The standardized result dictionary or None if not found
+        """
+        return await asyncio.to_thread(self.resolve, place_name, country_code, place_type, use_default_filter)
+
+    def _query_services(self,
+                        place_name: str,
+                        country_code: Union[str, None],
+                        place_type: Union[str, None],
+                        threshold: float,
+                        use_default_filter: bool = False,
+                        executor: Optional[ThreadPoolExecutor] = None) -> Union[dict, None]:
+        """
+        Query the services and return the best result according to the service order.
+
+        When `parallel` is enabled, all services are queried at once from a thread pool.
+        A match is returned as soon as every higher-priority service has finished without
+        a match; if `priority_window` is set, the resolver only waits that many seconds for
+        the higher-priority services before returning the match it already has.
+        Once a result is returned, lookups that have not started are cancelled and running
+        lookups stop before sending their next request.
+        """
+        if executor is None:
+            executor = self._executor
+        if executor is None:
+            for service, service_key in zip(self.services, self._service_keys):
+                result = self._resolve_service(service, service_key, place_name, country_code, place_type, threshold, use_default_filter)
+                if result:
+                    return result
+            return None
+
+        cancel = threading.Event()
+        futures = [
+            executor.submit(self._resolve_service, service, service_key, place_name, country_code,
+                            place_type, threshold, use_default_filter, cancel)
+            for service, service_key in zip(self.services, self._service_keys)
+        ]
+        priority = {future: i for i, future in enumerate(futures)}
+
+        try:
+            hits = {}
+            # Services whose result has been read; only these count as finished without a match
+            finished = set()
+            pending = set(futures)
+            deadline = None
+            while pending:
+                timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                if not done:
+                    service_name = self.services[min(hits)].__class__.__name__
+                    self.logger.info(f"Priority window expired for '{place_name}', using the result from {service_name}")
+                    break
+
+                for future in done:
+                    result = future.result()
+                    finished.add(priority[future])
+                    if result:
+                        hits[priority[future]] = result
+
+                if hits:
+                    best = min(hits)
+                    if all(i in finished for i in range(best)):
+                        break
+                    if deadline is None and self.priority_window is not None:
+                        deadline = time.monotonic() + self.priority_window
+
+            return hits[min(hits)] if hits else None
+        finally:
+            cancel.set()
+            for future in futures:
+                future.cancel()
+
+    def _validate_input(self,
+                        place_name: str,
+                        country_code: Union[str, None]) -> Tuple[Union[str, None], Union[str, None]]:
+        """
+        Validate and normalize the place name and country code before querying the services.
+        Returns (None, None) if the place name is not valid.
+        """
 
         if not place_name or not isinstance(place_name, str):
             self.logger.error("place_name must be a non-empty string")
-            return None
+            return None, None
 
         place_name = place_name.strip()
 
@@ -924,45 +1311,280 @@ class PlaceResolver:
         except Exception as e:
             self.logger.info(f"Error occurred while validating country code: {e}")
 
+        return place_name, country_code
+
+    def _get_cached(self, key: tuple) -> Union[dict, None]:
+        """
+        Look up a resolved place in the in-memory cache, then in the persistent cache.
+        The key is (place_name, country_code, place_type, use_default_filter).
+        """
+        cached = self._resolved_cache.get(key)
+        if cached is None and self._persistent_cache is not None:
+            place_name, country_code, place_type, use_default_filter = key
+            cached = self._persistent_cache.get(place_name, country_code, place_type,
+                                                f"{self._cache_config}|{use_default_filter}")
+            if cached is not None:
+                self._resolved_cache.set(key, cached)
+
+        if cached is None:
+            return None
+
+        self.logger.info(f"[CACHE HIT] '{key[0]}' resolved via {cached.get('source')}")
+        return dict(cached)
+
+    def _set_cached(self, key: tuple, result: dict, pending_writes: Optional[deque] = None) -> None:
+        """
+        Store a resolved place in the in-memory cache and in the persistent cache. If
+        `pending_writes` is given, the persistent write is deferred until `_flush_cache`.
+        """
+        self._resolved_cache.set(key, dict(result))
+        if self._persistent_cache is None:
+            return
+        if pending_writes is not None:
+            pending_writes.append((key, result))
+        else:
+            self._flush_cache(deque([(key, result)]))
+
+    def _flush_cache(self, pending_writes: deque) -> None:
+        """
+        Write the deferred results to the persistent cache in a single transaction.
+        """
+        entries = []
+        while pending_writes:
+            (place_name, country_code, place_type, use_default_filter), result = pending_writes.popleft()
+            entries.append((place_name, country_code, place_type, f"{self._cache_config}|{use_default_filter}", result))
+        if not entries or self._persistent_cache is None:
+            return
+        try:
+            self._persistent_cache.set_many(entries)
+        except Exception as e:
+            self.logger.warning(f"Could not store {len(entries)} places in the resolved places cache: {e}")
+
+    def _get_threshold(self, place_name: str) -> float:
         if self.flexible_threshold and len(place_name) < 5:
             self.logger.warning(
                 f"Using flexible threshold for short place name: '{place_name}'"
             )
-            threshold = self.flexible_threshold_value
-        else:
-            threshold = self.threshold
-
-        for service in self.services:
-            try:
-                self.logger.info(f"Trying {service.__class__.__name__} for '{place_name}'")
-                mapper = PlaceTypeMapper(self.places_map)
-                service_key = service.__class__.__name__.lower().replace("query", "")
-
-                resolved_type = None
-
-                if place_type:
-                    resolved_type = mapper.get_for_service(place_type, service_key)
-                    if resolved_type is None and use_default_filter:
-                        self.logger.warning(
-                            f"Unrecognized place_type '{place_type}' for service '{service_key}', falling back to 'pueblo'."
-                        )
-                        resolved_type = mapper.get_for_service("pueblo", service_key)
-                    elif resolved_type is None:
-                        self.logger.debug(
-                            f"Skipping place_type filter for service '{service_key}' (unrecognized type: '{place_type}')."
-                        )
-
-                results = service.places_by_name(place_name, country_code, resolved_type, lang=self.lang)
-                result = service.get_best_match(results, place_name, fuzzy_threshold=threshold, lang=self.lang)
-                if result:
-                    self.logger.info(f"Resolved '{place_name}' via {service.__class__.__name__}: {result}")
-                    return result
-            except Exception as e:
-                traceback_str = traceback.format_exc()
-                self.logger.warning(f"{service.__class__.__name__} failed for '{place_name}': {e}\n{traceback_str}")
-        self.logger.warning(f"Could not resolve '{place_name}' via any service.")
+            return self.flexible_threshold_value
+        return self.threshold
+
+    def _resolve_service(self,
+                         service: BaseQuery,
+                         service_key: str,
+                         place_name: str,
+                         country_code: Union[str, None],
+                         place_type: Union[str, None],
+                         threshold: float,
+                         use_default_filter: bool = False,
+                         cancel: Optional[threading.Event] = None) -> Union[dict, None]:
+        """
+        Query a single service and return its best match, or None if the service
+        has no suitable match or fails. If `cancel` is set, the lookup stops before
+        sending its next request.
+        """
+        try:
+            if cancel is not None and cancel.is_set():
+                return None
+            self.logger.info(f"Trying {service.__class__.__name__} for '{place_name}'")
+            resolved_type = self._resolve_place_type(service_key, place_type, use_default_filter)
+            results = service.places_by_name(place_name, country_code, resolved_type, lang=self.lang)
+            if cancel is not None and cancel.is_set():
+                return None
+            result = service.get_best_match(results, place_name, fuzzy_threshold=threshold, lang=self.lang)
+            if result:
+                self.logger.info(f"Resolved '{place_name}' via {service.__class__.__name__}: {result}")
+                return result
+        except Exception as e:
+            traceback_str = traceback.format_exc()
+            self.logger.warning(f"{service.__class__.__name__} failed for '{place_name}': {e}\n{traceback_str}")
         return None
 
+    def _resolve_place_type(self,
+                            service_key: str,
+                            place_type: Union[str, None],
+                            use_default_filter: bool = False) -> Union[str, None]:
+        """
+        Translate the place type into the vocabulary of the given service using the places map.
+        """
+        if not place_type:
+            return None
+
+        resolved_type = self._mapper.get_for_service(place_type, service_key)
+        if resolved_type is None and use_default_filter:
+            self.logger.warning(
+                f"Unrecognized place_type '{place_type}' for service '{service_key}', falling back to 'pueblo'."
+            )
+            resolved_type = self._mapper.get_for_service("pueblo", service_key)
+        elif resolved_type is None:
+            self.logger.debug(
+                f"Skipping place_type filter for service '{service_key}' (unrecognized type: '{place_type}')."
+            )
+        return resolved_type
+
+    def resolve_many(self,
+                     places: Iterable[Union[str, Tuple[str, Union[str, None], Union[str, None]]]],
+                     use_default_filter: bool = False) -> List[Union[dict, None]]:
+        """
+        Resolve several places at once, reducing the number of requests sent to each service.
+
+        Places are grouped by country code and place type, and each group is sent to the
+        services through `places_by_names`: TGN searches all the names of a group with a
+        single SPARQL query, and GeoNames sends its requests concurrently. Services are still
+        tried in order, and only the places not resolved by a previous service are sent to
+        the next one.
+
+        Args:
+            places (Iterable): Place names, or (place_name, country_code, place_type) tuples.
+            use_default_filter (bool): If True, apply a default filter as fallback in case the place_type is not found.
+
+        Returns:
+            List[Union[dict, None]]: One result per input place, in the same order.
+        """
+        keys = []
+        pending = {}
+        resolved = {}
+
+        pending_writes = deque()
+
+        for place in places:
+            place_name, country_code, place_type = self._split_place(place)
+
+            place_name, country_code = self._validate_input(place_name, country_code)
+            if place_name is None:
+                keys.append(None)
+                continue
+
+            key = (place_name, country_code, place_type, use_default_filter)
+            keys.append(key)
+            if key in resolved or key in pending:
+                continue
+
+            cached = self._get_cached(key)
+            if cached is not None:
+                resolved[key] = cached
+            else:
+                pending[key] = (place_name, country_code, place_type)
+
+        for service, service_key in zip(self.services, self._service_keys):
+            if not pending:
+                break
+
+            groups: Dict[tuple, List[str]] = {}
+            for place_name, country_code, place_type in pending.values():
+                groups.setdefault((country_code, place_type), []).append(place_name)
+
+            for (country_code, place_type), names in groups.items():
+                try:
+                    self.logger.info(f"Trying {service.__class__.__name__} for {len(names)} places")
+                    resolved_type = self._resolve_place_type(service_key, place_type, use_default_filter)
+                    results = service.places_by_names(names, country_code, resolved_type, lang=self.lang)
+                except Exception as e:
+                    traceback_str = traceback.format_exc()
+                    self.logger.warning(f"{service.__class__.__name__} failed for {names}: {e}\n{traceback_str}")
+                    continue
+
+                for place_name in names:
+                    if place_name not in results:
+                        continue
+                    try:
+                        result = service.get_best_match(results[place_name], place_name,
+                                                        fuzzy_threshold=self._get_threshold(place_name),
+                                                        lang=self.lang)
+                    except Exception as e:
+                        traceback_str = traceback.format_exc()
+                        self.logger.warning(f"{service.__class__.__name__} failed for '{place_name}': {e}\n{traceback_str}")
+                        continue
+                    if result:
+                        key = (place_name, country_code, place_type, use_default_filter)
+                        self.logger.info(f"Resolved '{place_name}' via {service.__class__.__name__}: {result}")
+                        self._set_cached(key, result, pending_writes)
+                        resolved[key] = result
+                        pending.pop(key, None)
+
+        self._flush_cache(pending_writes)
+
+        for place_name, _, _ in pending.values():
+            self.logger.warning(f"Could not resolve '{place_name}' via any service.")
+
+        return [dict(resolved[key]) if key in resolved else None for key in keys]
+
+    async def resolve_many_async(self,
+                                 places: Iterable[Union[str, Tuple[str, Union[str, None], Union[str, None]]]],
+                                 use_default_filter: bool = False,
+                                 concurrency: int = 32) -> List[Union[dict, None]]:
+        """
+        Resolve several places concurrently, keeping up to `concurrency` places in flight.
+
+        Each place is resolved as with `resolve`, so the rate limit of each service still
+        applies and bounds the throughput. Duplicated places are resolved only once, and new
+        results are written to the persistent cache in batches of 100.
+
+        Args:
+            places (Iterable): Place names, or (place_name, country_code, place_type) tuples.
+            use_default_filter (bool): If True, apply a default filter as fallback in case the place_type is not found.
+            concurrency (int): Maximum number of places resolved at the same time.
+
+        Returns:
+            List[Union[dict, None]]: One result per input place, in the same order.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be a positive integer")
+
+        loop = asyncio.get_running_loop()
+        # The default executor is limited to a few threads; use one sized for the requested concurrency
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        executors = [executor]
+        # The resolver's own pool is sized for a few places at a time, so the service
+        # lookups of this call get a pool that keeps every place in flight
+        service_executor = None
+        if self._executor is not None:
+            service_executor = ThreadPoolExecutor(max_workers=concurrency * len(self.services))
+            executors.append(service_executor)
+        semaphore = asyncio.Semaphore(concurrency)
+        pending_writes = deque()
+        completed = 0
+
+        async def resolve_one(place_name, country_code, place_type):
+            nonlocal completed
+            async with semaphore:
+                result = await loop.run_in_executor(executor, self._resolve, place_name, country_code,
+                                                    place_type, use_default_filter, pending_writes,
+                                                    service_executor)
+            completed += 1
+            if completed % 100 == 0:
+                # Write from a worker thread so the event loop is not blocked by SQLite
+                await loop.run_in_executor(executor, self._flush_cache, pending_writes)
+            return result
+
+        places = [self._split_place(place) for place in places]
+        unique_places = list(dict.fromkeys(places))
+        try:
+            results = await asyncio.gather(*(resolve_one(*place) for place in unique_places))
+        except BaseException:
+            # Lookups already running still append their results; store them once they finish
+            threading.Thread(target=self._close_executors, args=(executors, pending_writes)).start()
+            raise
+        await asyncio.to_thread(self._close_executors, executors, pending_writes)
+
+        resolved = dict(zip(unique_places, results))
+        return [dict(resolved[place]) if resolved[place] else None for place in places]
+
+    def _close_executors(self, executors: List[ThreadPoolExecutor], pending_writes: deque) -> None:
+        """
+        Wait for the lookups of `resolve_many_async` to finish and store their results.
+        """
+        for executor in executors:
+            executor.shutdown(wait=True, cancel_futures=True)
+        self._flush_cache(pending_writes)
+
+    def _split_place(self, place) -> Tuple[Union[str, None], Union[str, None], Union[str, None]]:
+        """
+        Normalize an input of `resolve_many` into a (place_name, country_code, place_type) tuple.
+        """
+        if isinstance(place, str) or place is None:
+            return place, None, None
+        return (tuple(place) + (None, None))[:3]
+
     def resolve_batch(
             self,
             df: pd.DataFrame,
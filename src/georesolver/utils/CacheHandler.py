@@ -0,0 +1,145 @@
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Iterable, Optional, Tuple
+
+import orjson
+
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    A small thread-safe, in-memory least-recently-used cache.
+
+    HTTP responses are already persisted by `requests_cache`; this cache keeps
+    parsed objects in memory so repeated lookups skip both the request and the parsing.
+
+    Args:
+        maxsize (int): Maximum number of entries to keep. The least recently used
+                       entry is evicted when the cache is full.
+        ttl (Optional[float]): Time to live of each entry in seconds. Entries never
+                               expire if not provided.
+    """
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        with self._lock:
+            if key not in self._data:
+                return default
+            value, expires_at = self._data[key]
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+class ResolvedCache:
+    """
+    A persistent SQLite cache of resolved places.
+
+    Each row stores the coordinates, the source and the full result dictionary of a
+    resolved place, keyed by place name, country code, place type and a configuration
+    string describing the resolver settings that produced the result.
+
+    Args:
+        path (str): Path to the SQLite database file.
+        expire_after (Optional[int]): Age in seconds after which an entry is ignored.
+                                      Entries never expire if not provided.
+    """
+    def __init__(self, path: str, expire_after: Optional[int] = None):
+        self.path = path
+        self.expire_after = expire_after
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS resolved (
+                    place_name TEXT NOT NULL,
+                    country TEXT NOT NULL,
+                    type TEXT NOT NULL,
+                    config TEXT NOT NULL,
+                    lat REAL,
+                    lon REAL,
+                    source TEXT,
+                    result TEXT NOT NULL,
+                    ts REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute(
+                "CREATE UNIQUE INDEX IF NOT EXISTS resolved_key ON resolved(place_name, country, type, config)"
+            )
+
+    def get(self,
+            place_name: str,
+            country_code: Optional[str],
+            place_type: Optional[str],
+            config: str) -> Optional[dict]:
+        min_ts = time.time() - self.expire_after if self.expire_after is not None else 0
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result FROM resolved WHERE place_name = ? AND country = ? AND type = ? AND config = ? AND ts > ?",
+                (place_name, country_code or "", place_type or "", config, min_ts)
+            ).fetchone()
+        return orjson.loads(row[0]) if row else None
+
+    def set(self,
+            place_name: str,
+            country_code: Optional[str],
+            place_type: Optional[str],
+            config: str,
+            result: dict) -> None:
+        self.set_many([(place_name, country_code, place_type, config, result)])
+
+    def set_many(self, entries: Iterable[Tuple[str, Optional[str], Optional[str], str, dict]]) -> None:
+        """
+        Store several resolved places in a single transaction.
+        Each entry is a (place_name, country_code, place_type, config, result) tuple.
+        """
+        now = time.time()
+        rows = [
+            (place_name, country_code or "", place_type or "", config,
+             result.get("latitude"), result.get("longitude"), result.get("source"),
+             orjson.dumps(result).decode("utf-8"), now)
+            for place_name, country_code, place_type, config, result in entries
+        ]
+        if not rows:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO resolved VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -1,9 +1,39 @@
+import atexit
 import logging
+import queue
 import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
+
+# All loggers enqueue their records here; a single background listener writes them
+# to stdout, so log I/O does not block the threads that query the services.
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_listener = None
+_listener_lock = threading.Lock()
+
+
+def _start_listener() -> None:
+    """
+    Start the background listener that writes queued records to stdout, once per process.
+    """
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            return
+        handler = logging.StreamHandler(sys.stdout)
+        formatter = logging.Formatter(
+            "%(asctime)s - %(levelname)s - %(message)s", "%Y-%m-%d %H:%M:%S"
+        )
+        handler.setFormatter(formatter)
+        _listener = QueueListener(_log_queue, handler)
+        _listener.start()
+        atexit.register(_listener.stop)
+
 
 def setup_logger(name="GeoResolver", verbose: bool = False) -> logging.Logger:
     """
     Set up a logger that outputs to stdout and respects a verbosity flag.
+    Records are handed to a background thread through a queue.
     
     Args:
         name (str): Logger name.
@@ -16,12 +46,10 @@ def setup_logger(name="GeoResolver", verbose: bool = False) -> logging.Logger:
     level = logging.INFO if verbose else logging.WARNING
     logger.setLevel(level)
 
-    if not logger.handlers:
-        handler = logging.StreamHandler(sys.stdout)
-        formatter = logging.Formatter(
-            "%(asctime)s - %(levelname)s - %(message)s", "%Y-%m-%d %H:%M:%S"
-        )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+    if logger.handlers:
+        return logger
+
+    _start_listener()
+    logger.addHandler(QueueHandler(_log_queue))
 
-    return logger
\ No newline at end of file
+    return logger
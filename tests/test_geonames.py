@@ -1,3 +1,7 @@
+from types import SimpleNamespace
+
+import orjson
+
 from georesolver import GeoNamesQuery, PlaceResolver
 
 def test_geonames_query():
@@ -13,4 +17,45 @@ def test_geonames_query():
     assert coordinates is not None, "1. Coordinates should not be None"
     assert isinstance(coordinates, dict), "2. Coordinates should be a dict"
     assert "latitude" in coordinates and "longitude" in coordinates, "3. Coordinates should contain latitude and longitude"
-    assert coordinates["latitude"] == 40.71427 and coordinates["longitude"] == -74.00597, f"4. Coordinates {coordinates} do not match expected values for New York, US" # type: ignore
\ No newline at end of file
+    assert coordinates["latitude"] == 40.71427 and coordinates["longitude"] == -74.00597, f"4. Coordinates {coordinates} do not match expected values for New York, US" # type: ignore
+
+class StubGeoNamesQuery(GeoNamesQuery):
+    """
+    GeoNames service answering from canned responses instead of the API.
+    Alternate names are only included in FULL responses.
+    """
+    def __init__(self):
+        super().__init__(geonames_username="stub")
+        self.requests = []
+
+    def _limited_get(self, url, params=None):
+        params = params or {}
+        self.requests.append(params)
+        geonames = [
+            {"name": "Foo", "toponymName": "Foo", "lat": "1", "lng": "2", "geonameId": 1, "countryCode": "ES"},
+            {"name": "Zaragoza", "toponymName": "Zaragoza", "lat": "41.65606", "lng": "-0.87734", "geonameId": 2, "countryCode": "ES"}
+        ]
+        if params.get("style") == "FULL":
+            geonames[1]["alternateNames"] = [{"name": "Caesaraugusta", "lang": "la"}]
+        return SimpleNamespace(content=orjson.dumps({"geonames": geonames}))
+
+
+def test_geonames_alternate_names_fallback():
+    service = StubGeoNamesQuery()
+
+    results = service.places_by_name("Caesaraugusta", "ES", lang="es")
+    assert set(results) == {"geonames"}, "1. The response should be returned unchanged"
+
+    match = service.get_best_match(results, "Caesaraugusta", fuzzy_threshold=90, lang="es")
+    assert match is not None and match["id"] == 2, "2. The place should be matched by its alternate name"
+    assert [request["style"] for request in service.requests] == ["SHORT", "FULL"], "3. Alternate names should be requested once"
+    assert all(request["username"] == "stub" for request in service.requests), "4. Requests should be authenticated"
+
+
+def test_geonames_short_match():
+    service = StubGeoNamesQuery()
+
+    results = service.places_by_name("Zaragoza", "ES")
+    match = service.get_best_match(results, "Zaragoza", fuzzy_threshold=90)
+    assert match is not None and match["id"] == 2, "1. The place should be matched by its name"
+    assert [request["style"] for request in service.requests] == ["SHORT"], "2. Alternate names should not be requested"
@@ -1,9 +1,15 @@
+import asyncio
+import threading
+import time
+
 from georesolver import (    GeoNamesQuery,
     TGNQuery,
     WikidataQuery,
     WHGQuery,
     PlaceResolver
 )
+from georesolver.base import BaseQuery
+from georesolver.resolver import _similarity_scores
 
 def test_geonames_query():
     service = [GeoNamesQuery(), WHGQuery(), WikidataQuery(), TGNQuery()]
@@ -18,4 +24,232 @@ def test_geonames_query():
     assert coordinates is not None, "1. Coordinates should not be None"
     assert isinstance(coordinates, dict), "2. Coordinates should be a dict"
     assert "latitude" in coordinates and "longitude" in coordinates, "3. Coordinates should contain latitude and longitude"
-    assert coordinates["latitude"] == 40.71427 and coordinates["longitude"] == -74.00597, f"4. Coordinates {coordinates} do not match expected values for New York, US"
\ No newline at end of file
+    assert coordinates["latitude"] == 40.71427 and coordinates["longitude"] == -74.00597, f"4. Coordinates {coordinates} do not match expected values for New York, US"
+
+def test_resolve_async():
+    service = [GeoNamesQuery(), WHGQuery(), WikidataQuery(), TGNQuery()]
+
+    resolver = PlaceResolver(service, threshold=75)
+
+    coordinates = asyncio.run(resolver.resolve_async("New York", "US", "city"))
+    assert coordinates is not None, "1. Coordinates should not be None"
+    assert coordinates["source"] == "GeoNames", "2. The first service in the list should take precedence"
+    assert coordinates["latitude"] == 40.71427 and coordinates["longitude"] == -74.00597, f"3. Coordinates {coordinates} do not match expected values for New York, US"
+
+
+def test_resolve_many():
+    service = [GeoNamesQuery(), WHGQuery(), WikidataQuery(), TGNQuery()]
+
+    resolver = PlaceResolver(service, threshold=75)
+
+    results = resolver.resolve_many([("New York", "US", "city"), ("Madrid", "ES", "city"), ("New York", "US", "city")])
+    assert len(results) == 3, "1. There should be one result per input place"
+    assert all(result is not None for result in results), "2. All places should be resolved"
+    assert results[0]["latitude"] == 40.71427 and results[0]["longitude"] == -74.00597, f"3. Coordinates {results[0]} do not match expected values for New York, US"
+    assert results[0] == results[2], "4. Duplicated places should have the same result"
+
+
+def test_resolve_many_async():
+    service = [GeoNamesQuery(), WHGQuery(), WikidataQuery(), TGNQuery()]
+
+    resolver = PlaceResolver(service, threshold=75)
+
+    places = [("New York", "US", "city"), ("Madrid", "ES", "city"), ("Rome", "IT", "city")]
+    results = asyncio.run(resolver.resolve_many_async(places, concurrency=4))
+    assert len(results) == len(places), "1. There should be one result per input place"
+    assert all(result is not None for result in results), "2. All places should be resolved"
+    assert results[0]["latitude"] == 40.71427 and results[0]["longitude"] == -74.00597, f"3. Coordinates {results[0]} do not match expected values for New York, US"
+
+
+class StubQuery(BaseQuery):
+    """
+    Offline service that answers after `delay` seconds with a match, or with no match.
+    """
+    def __init__(self, source, delay=0.0, match=True):
+        super().__init__(base_url="http://localhost", enable_cache=False)
+        self.source = source
+        self.delay = delay
+        self.match = match
+        self.calls = 0
+        self.matches = 0
+
+    def places_by_name(self, place_name, country_code, place_type=None, lang=None):
+        self.calls += 1
+        time.sleep(self.delay)
+        return [place_name] if self.match else []
+
+    def get_best_match(self, results, place_name, fuzzy_threshold, lang=None):
+        if not results:
+            return None
+        self.matches += 1
+        return {"place": place_name, "latitude": 1.0, "longitude": 2.0, "source": self.source}
+
+
+class SlowQuery(StubQuery):
+    pass
+
+
+class FastQuery(StubQuery):
+    pass
+
+
+class EmptyQuery(StubQuery):
+    pass
+
+
+def test_parallel_resolve_respects_priority():
+    resolver = PlaceResolver([SlowQuery("slow", delay=0.2), FastQuery("fast")], enable_cache=False)
+
+    result = resolver.resolve("Madrid", "ES")
+    assert result is not None and result["source"] == "slow", "1. The highest-priority match should be returned"
+
+    resolver = PlaceResolver([EmptyQuery("empty", delay=0.1, match=False), FastQuery("fast")], enable_cache=False)
+
+    result = resolver.resolve("Madrid", "ES")
+    assert result is not None and result["source"] == "fast", "2. A lower-priority match should be returned when higher-priority services miss"
+
+
+def test_parallel_resolve_priority_window():
+    resolver = PlaceResolver([SlowQuery("slow", delay=1.0), FastQuery("fast")],
+                             enable_cache=False, priority_window=0.05)
+
+    start = time.monotonic()
+    result = resolver.resolve("Madrid", "ES")
+    assert result is not None and result["source"] == "fast", "1. The lower-priority match should be returned after the window"
+    assert time.monotonic() - start < 0.5, "2. The resolver should not wait for the slow service"
+
+
+def test_parallel_resolve_stops_stale_lookups():
+    fast = FastQuery("fast")
+    slow = SlowQuery("slow", delay=0.2)
+    resolver = PlaceResolver([fast, slow], enable_cache=False)
+
+    threads = threading.active_count()
+    for i in range(20):
+        result = resolver.resolve(f"Place {i}", "ES")
+        assert result is not None and result["source"] == "fast", "1. The first service should resolve every place"
+
+    assert threading.active_count() - threads <= resolver._executor._max_workers, "2. Lookups should share a bounded thread pool"
+
+    time.sleep(0.5)
+    assert slow.matches == 0, "3. Stale lookups should stop before matching their results"
+
+
+def test_persistent_cache_skips_services(tmp_path):
+    cache_name = str(tmp_path / "resolved_cache")
+
+    service = FastQuery("fast")
+    resolver = PlaceResolver([service], cache_name=cache_name)
+    first = resolver.resolve("Madrid", "ES")
+    assert service.calls == 1, "1. The first lookup should query the service"
+
+    service = FastQuery("fast")
+    resolver = PlaceResolver([service], cache_name=cache_name)
+    assert resolver.resolve("Madrid", "ES") == first, "2. The cached result should be returned"
+    assert service.calls == 0, "3. A cached place should not query any service"
+
+
+def test_persistent_cache_key_includes_config(tmp_path):
+    cache_name = str(tmp_path / "resolved_cache")
+
+    PlaceResolver([FastQuery("fast")], cache_name=cache_name).resolve("Madrid", "ES")
+
+    service = FastQuery("fast")
+    PlaceResolver([service], cache_name=cache_name, threshold=80).resolve("Madrid", "ES")
+    assert service.calls == 1, "1. A different threshold should not reuse the cached result"
+
+    service = SlowQuery("slow")
+    result = PlaceResolver([service], cache_name=cache_name).resolve("Madrid", "ES")
+    assert service.calls == 1, "2. A different list of services should not reuse the cached result"
+    assert result is not None and result["source"] == "slow", "3. The result should come from the configured service"
+
+
+def test_similarity_scores_empty_names():
+    assert _similarity_scores("...", ["", "a"]) == [0.0, 0.0], "1. A name without letters or digits should not match"
+    assert _similarity_scores("Roma", ["", "Roma!"]) == [0.0, 100.0], "2. Empty candidate names should not match"
+
+
+def test_places_map_is_not_shared():
+    resolver = PlaceResolver([FastQuery("fast")], enable_cache=False)
+    resolver.places_map["city"]["fast"] = "changed"
+
+    other = PlaceResolver([FastQuery("fast")], enable_cache=False)
+    assert other._resolve_place_type("fast", "city") is None, "Changes to a resolver's places map should not affect other resolvers"
+
+
+def test_places_map_assignment():
+    resolver = PlaceResolver([FastQuery("fast")], enable_cache=False)
+    assert resolver._resolve_place_type("fast", "city") is None, "1. The default mapping has no types for the stub service"
+
+    places_map = dict(resolver.places_map)
+    places_map["city"] = {**places_map["city"], "fast": "town"}
+    resolver.places_map = places_map
+    assert resolver._resolve_place_type("fast", "City") == "town", "2. An assigned mapping should be used for resolution"
+
+
+def test_resolve_many_async_concurrency(tmp_path):
+    services = [EmptyQuery("empty", delay=0.1, match=False) for _ in range(3)] + [FastQuery("fast", delay=0.1)]
+    resolver = PlaceResolver(services, cache_name=str(tmp_path / "resolved_cache"))
+
+    places = [f"Place {i}" for i in range(32)]
+    start = time.monotonic()
+    results = asyncio.run(resolver.resolve_many_async(places, concurrency=32))
+    elapsed = time.monotonic() - start
+
+    assert all(result is not None and result["source"] == "fast" for result in results), "1. All places should be resolved"
+    assert elapsed < 0.35, f"2. All places should be in flight at once, took {elapsed:.2f}s"
+
+    service = FastQuery("fast")
+    resolver = PlaceResolver([EmptyQuery("empty", match=False) for _ in range(3)] + [service],
+                             cache_name=str(tmp_path / "resolved_cache"))
+    assert resolver.resolve("Place 7") is not None and service.calls == 0, "3. Results should be stored in the persistent cache"
+
+
+class PartialQuery(StubQuery):
+    """
+    Offline service that only matches the given place names and records the names searched.
+    """
+    def __init__(self, source, names, fail=False):
+        super().__init__(source)
+        self.names = names
+        self.fail = fail
+        self.searched = []
+
+    def places_by_names(self, place_names, country_code, place_type=None, lang=None):
+        self.searched.append(list(place_names))
+        if self.fail:
+            raise ConnectionError(f"{self.source} is unavailable")
+        return {name: [name] if name in self.names else [] for name in place_names}
+
+
+class OtherPartialQuery(PartialQuery):
+    pass
+
+
+class BrokenQuery(PartialQuery):
+    pass
+
+
+def test_resolve_many_sends_only_unresolved_places():
+    first = PartialQuery("first", {"Madrid", "Lima"})
+    second = OtherPartialQuery("second", {"Lima", "Quito"})
+    resolver = PlaceResolver([first, second], enable_cache=False)
+
+    places = ["Madrid", ("Lima", "PE"), ("Quito", "EC"), "Atlantis", "Madrid", ""]
+    results = resolver.resolve_many(places)
+
+    assert [result["source"] if result else None for result in results] == ["first", "first", "second", None, "first", None], "1. Services should be tried in order"
+    assert sorted(sum(first.searched, [])) == ["Atlantis", "Lima", "Madrid", "Quito"], "2. Duplicated and invalid places should be searched once or not at all"
+    assert sorted(sum(second.searched, [])) == ["Atlantis", "Quito"], "3. Only unresolved places should be sent to the next service"
+
+    results = resolver.resolve_many(["Madrid", "Atlantis"])
+    assert results[0]["source"] == "first" and first.searched[-1] == ["Atlantis"], "4. Resolved places should be answered from the cache"
+
+
+def test_resolve_many_skips_failing_service():
+    broken = BrokenQuery("broken", {"Madrid"}, fail=True)
+    fallback = OtherPartialQuery("fallback", {"Madrid"})
+    resolver = PlaceResolver([broken, fallback], enable_cache=False)
+
+    results = resolver.resolve_many(["Madrid"])
+    assert results[0] is not None and results[0]["source"] == "fallback", "A failing service should not stop the next ones"
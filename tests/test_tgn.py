@@ -1,4 +1,5 @@
 from georesolver import TGNQuery, PlaceResolver
+from georesolver.resolver import _sparql_escape
 
 def test_tgn_query():
     service = [TGNQuery()] 
@@ -14,3 +15,91 @@ def test_tgn_query():
     assert coordinates.get("latitude") == 41.9, "Latitude does not match expected value for Rome, Italy"
     assert coordinates.get("longitude") == 12.483333, "Longitude does not match expected value for Rome, Italy"
 
+
+def test_tgn_places_by_names():
+    tgn = TGNQuery()
+
+    results = tgn.places_by_names(["Rome", "Florence"], "IT", "inhabited places", lang="en")
+    assert set(results) == {"Rome", "Florence"}, "Results should be keyed by place name"
+
+    best_match = tgn.get_best_match(results["Rome"], "Rome", fuzzy_threshold=90, lang="en")
+    assert best_match is not None, "Rome should be found in the batch results"
+    assert best_match.get("source") == "TGN", "Source should be TGN"
+
+
+def test_sparql_escape():
+    assert _sparql_escape('Saint "Paul"') == 'Saint \\"Paul\\"', "1. Double quotes should be escaped"
+    assert _sparql_escape("C:\\Roma") == "C:\\\\Roma", "2. Backslashes should be escaped"
+    assert _sparql_escape("Roma\nItalia\r") == "Roma\\nItalia\\r", "3. Line breaks should be escaped"
+    assert _sparql_escape('\\"') == '\\\\\\"', "4. Each character should be escaped once"
+    assert _sparql_escape("Cuicatlán") == "Cuicatlán", "5. Other characters should be left unchanged"
+
+
+class StubTGNQuery(TGNQuery):
+    """
+    TGN service answering batch queries with one canned binding per known place name.
+    """
+    def __init__(self, known_names, fail=False):
+        super().__init__()
+        self.known_names = known_names
+        self.fail = fail
+        self.queries = []
+
+    def _run_query(self, query):
+        self.queries.append(query)
+        if self.fail:
+            raise ConnectionError("TGN is unavailable")
+        bindings = [
+            {"term": {"value": name}, "p": {"value": f"http://vocab.getty.edu/tgn/{i}"}, "pLab": {"value": name}}
+            for i, name in enumerate(self.known_names)
+            if f'"{name}"' in query
+        ]
+        return {"results": {"bindings": bindings}}
+
+
+def test_tgn_places_by_names_groups_bindings():
+    tgn = StubTGNQuery(["Roma", "Milano"])
+    tgn.batch_size = 2
+
+    results = tgn.places_by_names(["Roma", "Milano", "Atlantis", "Roma"], "IT")
+    assert len(tgn.queries) == 2, "1. Names should be searched in batches of batch_size"
+    assert [b["pLab"]["value"] for b in results["Roma"]] == ["Roma"], "2. Bindings should be grouped by the searched name"
+    assert results["Atlantis"] == [], "3. Names without bindings should have no results"
+
+    assert tgn.places_by_names(["Milano", "Atlantis"], "IT") == {"Milano": results["Milano"], "Atlantis": []}, "4. Batch results should be cached"
+    assert tgn.places_by_name("Roma", "IT") == results["Roma"], "5. Batch results should be cached for single searches"
+    assert len(tgn.queries) == 2, "6. Cached names should not be searched again"
+
+
+def test_tgn_places_by_names_failed_batch():
+    tgn = StubTGNQuery(["Roma"], fail=True)
+
+    assert tgn.places_by_names(["Roma", "Milano"], "IT") == {"Roma": [], "Milano": []}, "1. A failed batch should have no results"
+
+    tgn.fail = False
+    results = tgn.places_by_names(["Roma"], "IT")
+    assert len(tgn.queries) == 2 and len(results["Roma"]) == 1, "2. Results of a failed batch should not be cached"
+
+
+def test_tgn_language_is_sanitized():
+    tgn = StubTGNQuery([])
+
+    tgn.places_by_name("Roma", "IT", "ciudad", lang='es"] }')
+    tgn.places_by_names(["Milano"], "IT", "ciudad", lang="es;")
+    assert all('[rdfs:label "ciudad"@es].' in query for query in tgn.queries), "The language tag should be sanitized"
+
+
+def test_tgn_record_without_coordinates():
+    tgn = StubTGNQuery([])
+    uri = "http://vocab.getty.edu/tgn/7000874"
+    tgn._lod_cache.set(uri, {"id": uri, "_label": "Roma", "identified_by": [
+        {"type": "crm:E47_Spatial_Coordinates", "value": "not coordinates"}
+    ]})
+    results = [{"p": {"value": uri}, "pLab": {"value": "Roma"}}]
+    assert not tgn.get_best_match(results, "Roma", fuzzy_threshold=90), "1. A record without valid coordinates should not match"
+
+    tgn._lod_cache.set(uri, {"id": uri, "_label": "Roma", "identified_by": [
+        {"type": "crm:E47_Spatial_Coordinates", "value": "[12.483333, 41.9]"}
+    ]})
+    match = tgn.get_best_match(results, "Roma", fuzzy_threshold=90)
+    assert match["latitude"] == 41.9 and match["longitude"] == 12.483333, "2. Coordinates should be read as [lon, lat]"
@@ -1,3 +1,7 @@
+from types import SimpleNamespace
+
+import orjson
+
 from georesolver import WikidataQuery, PlaceResolver
 
 def test_wikidata_query():
@@ -24,4 +28,65 @@ def test_wikidata_query():
     # Test approximate coordinates for New York City
     expected_lat, expected_lon = 40.71277777777778, -74.00611111111111
     assert abs(result['latitude'] - expected_lat) < 0.1, f"Latitude {result['latitude']} should be close to {expected_lat}"
-    assert abs(result['longitude'] - expected_lon) < 0.1, f"Longitude {result['longitude']} should be close to {expected_lon}"
\ No newline at end of file
+    assert abs(result['longitude'] - expected_lon) < 0.1, f"Longitude {result['longitude']} should be close to {expected_lon}"
+
+class StubWikidataQuery(WikidataQuery):
+    """
+    Wikidata service answering with canned SPARQL bindings instead of the Query Service.
+    """
+    def __init__(self, bindings):
+        super().__init__()
+        self.bindings = bindings
+        self.queries = []
+
+    def _limited_get(self, url, params=None):
+        self.queries.append(params["query"])
+        return SimpleNamespace(content=orjson.dumps({"results": {"bindings": self.bindings}}))
+
+
+def _binding(qid, label, coord, iso="US", admin=None):
+    binding = {
+        "item": {"value": f"http://www.wikidata.org/entity/{qid}"},
+        "itemLabel": {"value": label},
+        "coord": {"value": coord},
+        "country": {"value": "http://www.wikidata.org/entity/Q30"},
+        "iso": {"value": iso},
+    }
+    if admin:
+        binding["admin"] = {"value": f"http://www.wikidata.org/entity/{admin[0]}"}
+        binding["adminLabel"] = {"value": admin[1]}
+    return binding
+
+
+def test_wikidata_places_by_name_parses_bindings():
+    service = StubWikidataQuery([
+        _binding("Q60", "New York City", "Point(-74.006 40.7128)", admin=("Q1384", "New York")),
+        _binding("Q60", "New York City", "Point(-74.006 40.7128)", admin=("Q11299", "Manhattan")),
+        _binding("Q1", "Crater", "<http://www.wikidata.org/entity/Q405> Point(10 20)"),
+        _binding("Q2", "Broken", "Point(a b)"),
+        _binding("Q1384", "New York", "Point(-75 43)"),
+    ])
+
+    results = service.places_by_name("New York", "US", "Q515", lang="en")
+    assert [result["qid"] for result in results] == ["Q60", "Q1384"], "1. Items should be deduplicated and those without Earth coordinates skipped"
+    assert results[0]["coordinates"] == (40.7128, -74.006), "2. WKT points should be parsed as (lat, lon)"
+    assert results[0]["admin_label"] == "New York" and results[0]["country_iso"] == "US", "3. The first row of each item should be kept"
+
+    match = service.get_best_match(results, "New York City", fuzzy_threshold=90, lang="en")
+    assert match is not None and match["id"] == "Q60" and match["part_of_uri"].endswith("Q1384"), "4. The best match should be post-filtered"
+
+
+def test_wikidata_query_filters():
+    service = StubWikidataQuery([])
+
+    service.places_by_name('New "York"', "us", "Q515", lang='en"}')
+    query = service.queries[-1]
+    assert 'FILTER(?iso = "US")' in query, "1. The country filter should use the upper-case ISO code"
+    assert "?item wdt:P31 wd:Q515." in query, "2. Class QIDs should be used as a type filter"
+    assert 'mwapi:language "en"' in query and 'wikibase:language "en,en"' in query, "3. The language should be sanitized"
+    assert 'mwapi:search "New \\"York\\""' in query, "4. The place name should be escaped"
+
+    service.places_by_name("New York", None, "city", lang=None)
+    query = service.queries[-1]
+    assert "FILTER(?iso" not in query and "wdt:P31" not in query, "5. No filter should be added without a country code or class QID"
+    assert 'mwapi:language "en"' in query, "6. English should be used by default"